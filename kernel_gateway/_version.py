@@ -3,17 +3,16 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 
-import re
 from typing import List
 
 # Version string must appear intact for automatic versioning
 __version__ = "3.0.1"
 
-# Build up version_info tuple for backwards compatibility
-pattern = r"(?P<major>\d+).(?P<minor>\d+).(?P<patch>\d+)(?P<rest>.*)"
-match = re.match(pattern, __version__)
-assert match is not None
-parts: List[object] = [int(match[part]) for part in ["major", "minor", "patch"]]
-if match["rest"]:
-    parts.append(match["rest"])
+# Build up version_info tuple for backwards compatibility, splitting with
+# plain string operations so importing the package doesn't pull in `re`
+_major, _minor, _rest = __version__.split(".", 2)
+_patch_len = len(_rest) - len(_rest.lstrip("0123456789"))
+parts: List[object] = [int(_major), int(_minor), int(_rest[:_patch_len])]
+if _rest[_patch_len:]:
+    parts.append(_rest[_patch_len:])
 version_info = tuple(parts)
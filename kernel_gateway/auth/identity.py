@@ -10,6 +10,9 @@ from jupyter_server.base.handlers import JupyterHandler
 from tornado import web
 from traitlets import default
 
+# Every field is constant, so all anonymous requests share a single instance
+_ANONYMOUS_USER = User("anonymous", "Anonymous", "Anonymous", "An", None, None)
+
 
 class GatewayIdentityProvider(IdentityProvider):
     """
@@ -22,9 +25,7 @@ class GatewayIdentityProvider(IdentityProvider):
 
     @property
     def auth_enabled(self):
-        if not self.token:
-            return False
-        return True
+        return bool(self.token)
 
     def should_check_origin(self, handler: JupyterHandler) -> bool:
         """Should the Handler check for CORS origin validation?
@@ -39,15 +40,12 @@ class GatewayIdentityProvider(IdentityProvider):
         return handler.settings["kg_allow_origin"] != "*"
 
     def generate_anonymous_user(self, handler: web.RequestHandler) -> User:
-        """Generate a random anonymous user.
+        """Return the anonymous user.
 
         For use when a single shared token is used,
         but does not identify a user.
         """
-        name = display_name = "Anonymous"
-        initials = "An"
-        color = None
-        return User(name.lower(), name, display_name, initials, None, color)
+        return _ANONYMOUS_USER
 
     def is_token_authenticated(self, handler: web.RequestHandler) -> bool:
         """The default authentication flow of Gateway is token auth.
@@ -19,16 +19,14 @@ class APIVersionHandler(
 class NotFoundHandler(JSONErrorsMixin, web.RequestHandler):
     """Catches all requests and responds with 404 JSON messages.
 
-    Installed as the fallback error for all unhandled requests.
-
-    Raises
-    ------
-    tornado.web.HTTPError
-        Always 404 Not Found
+    Installed as the fallback error for all unhandled requests. Always
+    responds with 404 Not Found.
     """
 
     def prepare(self):
-        raise web.HTTPError(404)
+        # Finish with the error response directly rather than raising
+        # web.HTTPError(404); this path is hit by every unmatched request
+        self.send_error(404)
 
 
 default_handlers = [(r"/api", APIVersionHandler), (r"/(.*)", NotFoundHandler)]
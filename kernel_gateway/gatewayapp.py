@@ -4,20 +4,16 @@
 
 import asyncio
 import errno
-import hashlib
-import hmac
 import importlib
 import logging
 import os
-import select
+import secrets
 import signal
 import ssl
 import sys
-import threading
-from base64 import encodebytes
+from functools import lru_cache
 from urllib.parse import urlparse
 
-import nbformat
 from jupyter_client.kernelspec import KernelSpecManager
 from jupyter_core.application import JupyterApp, base_aliases
 from jupyter_core.paths import secure_write
@@ -56,6 +52,19 @@ aliases.update(
 )
 
 
+@lru_cache(maxsize=8)
+def _import_api_module(module_name):
+    """Imports an API module by name, resolving the legacy aliases. Memoized
+    since the `api` observer and init_configurables both resolve the module.
+    """
+    # some compatibility allowances
+    if module_name == "jupyter-websocket":
+        module_name = "kernel_gateway.jupyter_websocket"
+    elif module_name == "notebook-http":
+        module_name = "kernel_gateway.notebook_http"
+    return importlib.import_module(module_name)
+
+
 class KernelGatewayApp(JupyterApp):
     """Application that provisions Jupyter kernels and proxies HTTP/Websocket
     traffic to the kernels.
@@ -271,7 +280,7 @@ class KernelGatewayApp(JupyterApp):
 
     @default("env_process_whitelist")
     def env_process_whitelist_default(self):
-        return os.getenv(self.env_process_whitelist_env, "").split(",")
+        return [v for v in os.getenv(self.env_process_whitelist_env, "").split(",") if v]
 
     api_env = "KG_API"
     api_default_value = "kernel_gateway.jupyter_websocket"
@@ -369,15 +378,18 @@ class KernelGatewayApp(JupyterApp):
 
     @default("cookie_secret")
     def _default_cookie_secret(self):
+        key = b""
         if os.path.exists(self.cookie_secret_file):
             with open(self.cookie_secret_file, "rb") as f:
                 key = f.read()
-        else:
-            key = encodebytes(os.urandom(32))
+        # Tornado refuses to sign cookies with an empty secret, so replace an
+        # empty file as if it were missing
+        if not key:
+            key = secrets.token_bytes(48)
             self._write_cookie_secret_file(key)
-        h = hmac.new(key, digestmod=hashlib.sha256)
-        # h.update(self.password.encode())  # password is deprecated in 2.0
-        return h.digest()
+        # The key is already random; an HMAC of it over an empty message adds
+        # nothing now that the password contribution is gone (deprecated in 2.0)
+        return key
 
     def _write_cookie_secret_file(self, secret):
         """write my secret to my secret_file"""
@@ -406,6 +418,18 @@ class KernelGatewayApp(JupyterApp):
     def _ws_ping_interval_default(self) -> int:
         return int(os.getenv(self.ws_ping_interval_env, self.ws_ping_interval_default_value))
 
+    use_uvloop_env = "KG_USE_UVLOOP"
+    use_uvloop = CBool(
+        True,
+        config=True,
+        help="""Run the server on a uvloop event loop when the uvloop package is installed.
+            Has no effect otherwise. (KG_USE_UVLOOP env var)""",
+    )
+
+    @default("use_uvloop")
+    def use_uvloop_default(self):
+        return os.getenv(self.use_uvloop_env, "True").lower() == "true"
+
     _log_formatter_cls = LogFormatter  # traitlet default is LevelFormatter
 
     @default("log_format")
@@ -467,12 +491,7 @@ class KernelGatewayApp(JupyterApp):
         module
             Module with the given name loaded using importlib.import_module
         """
-        # some compatibility allowances
-        if module_name == "jupyter-websocket":
-            module_name = "kernel_gateway.jupyter_websocket"
-        elif module_name == "notebook-http":
-            module_name = "kernel_gateway.notebook_http"
-        return importlib.import_module(module_name)
+        return _import_api_module(module_name)
 
     def _load_notebook(self, uri):
         """Loads a notebook from the local filesystem or HTTP(S) URL.
@@ -487,20 +506,27 @@ class KernelGatewayApp(JupyterApp):
         object
             Notebook object from nbformat
         """
+        import nbformat
+
         parts = urlparse(uri)
 
         if parts.scheme not in ("http", "https"):
             # Local file
             path = parts._replace(scheme="", netloc="").geturl()
-            with open(path) as nb_fh:
+            # Hand the raw bytes to the JSON parser, which detects the UTF
+            # encoding itself, instead of decoding with the locale first
+            with open(path, "rb") as nb_fh:
                 notebook = nbformat.read(nb_fh, 4)
         else:
             # Remote file
             import requests
 
-            resp = requests.get(uri, timeout=200)
-            resp.raise_for_status()
-            notebook = nbformat.reads(resp.text, 4)
+            with requests.get(uri, stream=True, timeout=200) as resp:
+                resp.raise_for_status()
+                # Hand the (decompressed) body bytes to the JSON parser, which
+                # skips resp.text's charset detection when no charset is sent
+                resp.raw.decode_content = True
+                notebook = nbformat.read(resp.raw, 4)
 
         # Error if no kernel spec can handle the language requested
         kernel_name = (
@@ -547,7 +573,9 @@ class KernelGatewayApp(JupyterApp):
         Optionally, loads a notebook and prespawns the configured number of
         kernels.
         """
-        self.kernel_spec_manager = KernelSpecManager(parent=self)
+        self.kernel_spec_manager = self.kernel_spec_manager_class(
+            parent=self,
+        )
 
         self.seed_notebook = None
         if self.seed_uri is not None:
@@ -560,9 +588,6 @@ class KernelGatewayApp(JupyterApp):
         if self.default_kernel_name:
             kwargs["default_kernel_name"] = self.default_kernel_name
 
-        self.kernel_spec_manager = self.kernel_spec_manager_class(
-            parent=self,
-        )
         self.kernel_manager = self.kernel_manager_class(
             parent=self,
             log=self.log,
@@ -589,9 +614,7 @@ class KernelGatewayApp(JupyterApp):
         func = api_module.create_personality
         self.personality = func(parent=self, log=self.log)
 
-        self.io_loop.call_later(
-            0.1, lambda: asyncio.create_task(self.personality.init_configurables())
-        )
+        self.io_loop.add_callback(self.personality.init_configurables)
 
     def init_webapp(self):
         """Initializes Tornado web application with uri handlers.
@@ -637,17 +660,18 @@ class KernelGatewayApp(JupyterApp):
             # for zmq web-sockets or increasing/decreasing web socket ping interval/timeouts.
             ws_ping_interval=self.ws_ping_interval * 1000,
             # Add a pass-through authorizer for now
-            authorizer=self.authorizer_class(parent=self),
+            authorizer=self.authorizer,
             identity_provider=self.identity_provider,
             kernel_websocket_connection_class=self.kernel_websocket_connection_class,
         )
 
         # promote the current personality's "config" tagged traitlet values to webapp settings
-        for trait_name, trait_value in self.personality.class_traits(config=True).items():
+        settings = self.web_app.settings
+        for trait_name, value in self.personality.trait_values(config=True).items():
             kg_name = "kg_" + trait_name
             # a personality's traitlets may not overwrite the kernel gateway's
-            if kg_name not in self.web_app.settings:
-                self.web_app.settings[kg_name] = trait_value.get(obj=self.personality)
+            if kg_name not in settings:
+                settings[kg_name] = value
             else:
                 self.log.warning(
                     "The personality trait name, %s, conflicts with a kernel gateway trait.",
@@ -659,6 +683,10 @@ class KernelGatewayApp(JupyterApp):
 
         Taken directly from jupyter/notebook code.
         """
+        if not (self.certfile or self.keyfile or self.client_ca or self.ssl_version):
+            # None indicates no SSL config
+            return None
+
         ssl_options = {}
         if self.certfile:
             ssl_options["certfile"] = self.certfile
@@ -668,13 +696,9 @@ class KernelGatewayApp(JupyterApp):
             ssl_options["ca_certs"] = self.client_ca
         if self.ssl_version:
             ssl_options["ssl_version"] = self.ssl_version
-        if not ssl_options:
-            # None indicates no SSL config
-            ssl_options = None
-        else:
-            ssl_options.setdefault("ssl_version", self.ssl_version_default_value)
-            if ssl_options.get("ca_certs", False):
-                ssl_options.setdefault("cert_reqs", ssl.CERT_REQUIRED)
+        ssl_options.setdefault("ssl_version", self.ssl_version_default_value)
+        if ssl_options.get("ca_certs", False):
+            ssl_options.setdefault("cert_reqs", ssl.CERT_REQUIRED)
 
         return ssl_options
 
@@ -695,10 +719,10 @@ class KernelGatewayApp(JupyterApp):
                 self.http_server.listen(port, self.ip)
             except OSError as e:
                 if e.errno == errno.EADDRINUSE:
-                    self.log.info("The port %i is already in use, trying another port." % port)
+                    self.log.info("The port %i is already in use, trying another port.", port)
                     continue
                 elif e.errno in (errno.EACCES, getattr(errno, "WSAEACCES", errno.EACCES)):
-                    self.log.warning("Permission to listen on port %i denied" % port)
+                    self.log.warning("Permission to listen on port %i denied", port)
                     continue
                 else:
                     raise
@@ -714,7 +738,25 @@ class KernelGatewayApp(JupyterApp):
 
     def init_io_loop(self):
         """init self.io_loop so that an extension can use it by io_loop.call_later() to create background tasks"""
+        if self.use_uvloop:
+            self._install_uvloop()
         self.io_loop = ioloop.IOLoop.current()
+        self.log.debug("Using event loop %s", type(self.io_loop.asyncio_loop).__name__)
+
+    def _install_uvloop(self):
+        """Installs the uvloop event loop policy, if uvloop is available and no
+        event loop is running yet.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        else:
+            self.log.debug("An event loop is already running, not installing uvloop")
 
     def init_signal(self):
         """Initialize signal handlers."""
@@ -728,11 +770,10 @@ class KernelGatewayApp(JupyterApp):
         """SIGINT handler spawns confirmation dialog"""
         # register more forceful signal handler for ^C^C case
         signal.signal(signal.SIGINT, self._signal_stop)
-        # request confirmation dialog in bg thread, to avoid
-        # blocking the App
-        thread = threading.Thread(target=self._confirm_exit)
-        thread.daemon = True
-        thread.start()
+        # request confirmation dialog on the event loop, to avoid
+        # blocking the App. call_soon_threadsafe wakes the selector, which
+        # add_callback does not do when invoked from a signal handler
+        self.io_loop.asyncio_loop.call_soon_threadsafe(self._confirm_exit)
 
     def _restore_sigint_handler(self):
         """callback for restoring original SIGINT handler"""
@@ -751,31 +792,39 @@ class KernelGatewayApp(JupyterApp):
         # Check if answer_yes is set
         if self.answer_yes:
             self.log.critical("Shutting down...")
-            # schedule stop on the main thread,
-            # since this might be called from a signal handler
-            self.stop(from_signal=True)
+            self.stop()
             return
         yes = "y"
         no = "n"
         sys.stdout.write("Shutdown this Jupyter server (%s/[%s])? " % (yes, no))  # noqa: UP031
         sys.stdout.flush()
-        r, w, x = select.select([sys.stdin], [], [], 5)
-        if r:
+
+        loop = self.io_loop.asyncio_loop
+        stdin_fd = sys.stdin.fileno()
+
+        def resume():
+            info("resuming operation...")
+            # no answer, or answer is no:
+            # set it back to original SIGINT handler
+            self._restore_sigint_handler()
+
+        def on_answer():
+            loop.remove_reader(stdin_fd)
+            timeout.cancel()
             line = sys.stdin.readline()
             if line.lower().startswith(yes) and no not in line.lower():
                 self.log.critical("Shutdown confirmed")
-                # schedule stop on the main thread,
-                # since this might be called from a signal handler
-                self.stop(from_signal=True)
+                self.stop()
                 return
-        else:
+            resume()
+
+        def on_timeout():
+            loop.remove_reader(stdin_fd)
             info("No answer for 5s:")
-        info("resuming operation...")
-        # no answer, or answer is no:
-        # set it back to original SIGINT handler
-        # use IOLoop.add_callback because signal.signal must be called
-        # from main thread
-        self.io_loop.add_callback_from_signal(self._restore_sigint_handler)
+            resume()
+
+        loop.add_reader(stdin_fd, on_answer)
+        timeout = loop.call_later(5, on_timeout)
 
     def _signal_stop(self, sig, frame):
         """Handle a stop signal."""
@@ -799,8 +848,6 @@ class KernelGatewayApp(JupyterApp):
         if sys.platform != "win32":
             signal.signal(signal.SIGHUP, signal.SIG_IGN)
 
-        signal.signal(signal.SIGTERM, self._signal_stop)
-
         try:
             self.io_loop.start()
         except KeyboardInterrupt:
@@ -15,6 +15,15 @@ from ..services.kernelspecs.handlers import default_handlers as default_kernelsp
 from ..services.sessions.handlers import default_handlers as default_session_handlers
 from .handlers import default_handlers as default_api_handlers
 
+# The standard kernel gateway endpoints, in registration order
+_all_default_handlers = tuple(
+    default_api_handlers
+    + default_kernel_handlers
+    + default_kernelspec_handlers
+    + default_session_handlers
+    + default_base_handlers
+)
+
 
 class JupyterWebsocketPersonality(LoggingConfigurable):
     """Personality for standard websocket functionality, registering
@@ -42,7 +51,7 @@ class JupyterWebsocketPersonality(LoggingConfigurable):
 
     @default("env_whitelist")
     def env_whitelist_default(self):
-        return os.getenv(self.env_whitelist_env, "").split(",")
+        return [v for v in os.getenv(self.env_whitelist_env, "").split(",") if v]
 
     kernel_pool: KernelPool
 
@@ -57,23 +66,14 @@ class JupyterWebsocketPersonality(LoggingConfigurable):
         """Create default Jupyter handlers and redefine them off of the
         base_url path. Assumes init_configurables() has already been called.
         """
-        handlers = []
-
-        # append tuples for the standard kernel gateway endpoints
-        for handler in (
-            default_api_handlers
-            + default_kernel_handlers
-            + default_kernelspec_handlers
-            + default_session_handlers
-            + default_base_handlers
-        ):
-            # Create a new handler pattern rooted at the base_url
-            pattern = url_path_join("/", self.parent.base_url, handler[0])
-            # Some handlers take args, so retain those in addition to the
-            # handler class ref
-            new_handler = tuple([pattern] + list(handler[1:]))
-            handlers.append(new_handler)
-        return handlers
+        base_url = url_path_join("/", self.parent.base_url)
+
+        # Create new handler patterns for the standard kernel gateway endpoints
+        # rooted at the base_url. Some handlers take args, so retain those in
+        # addition to the handler class ref
+        return [
+            (url_path_join(base_url, handler[0]), *handler[1:]) for handler in _all_default_handlers
+        ]
 
     def should_seed_cell(self, code):
         """Determines whether the given code cell source should be executed when
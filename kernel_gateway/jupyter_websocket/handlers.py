@@ -8,6 +8,9 @@ from tornado import web
 
 from ..mixins import CORSMixin
 
+# Directory holding the spec files served by the handlers below
+_spec_dir = os.path.dirname(__file__)
+
 
 class BaseSpecHandler(CORSMixin, web.StaticFileHandler):
     """Exposes the ability to return specifications from static files"""
@@ -22,7 +25,7 @@ class BaseSpecHandler(CORSMixin, web.StaticFileHandler):
         The handler is initialized to server files from the directory
         where this module is defined.
         """
-        web.StaticFileHandler.initialize(self, path=os.path.dirname(__file__))
+        web.StaticFileHandler.initialize(self, path=_spec_dir)
 
     async def get(self):
         """Handler for a get on a specific handler"""
@@ -2,12 +2,20 @@
 # Distributed under the terms of the Modified BSD License.
 """Mixins for Tornado handlers."""
 
+import hmac
 import json
 import traceback
 from http.client import responses
 
 from tornado import web
 
+# Pre-serialized reasons and bodies for errors raised without an exception,
+# e.g. send_error(401) from token checks and send_error(404) from NotFoundHandler
+_DEFAULT_ERROR_REPLIES = {
+    code: (responses[code], json.dumps({"reason": responses[code], "message": ""}))
+    for code in (400, 401, 403, 404, 405, 500)
+}
+
 
 class CORSMixin:
     """Mixes CORS headers into tornado.web.RequestHandlers."""
@@ -84,7 +92,10 @@ class TokenAuthorizationMixin:
                     client_token = client_token[self.header_prefix_len :]
                 else:
                     client_token = None
-            if client_token != server_token:
+            # Compare in constant time so response timing doesn't leak the token
+            if client_token is None or not hmac.compare_digest(
+                client_token.encode(), server_token.encode()
+            ):
                 return self.send_error(401)
         return super().prepare()
 
@@ -114,6 +125,13 @@ class JSONErrorsMixin:
         {"401", reason="Unauthorized", message="Invalid auth token"}
         """
         exc_info = kwargs.get("exc_info")
+        if not exc_info and status_code in _DEFAULT_ERROR_REPLIES:
+            reason, body = _DEFAULT_ERROR_REPLIES[status_code]
+            self.set_header("Content-Type", "application/json")
+            self.set_status(status_code, reason=reason)
+            self.finish(body)
+            return
+
         message = ""
         reason = responses.get(status_code, "Unknown HTTP Error")
         reply = {
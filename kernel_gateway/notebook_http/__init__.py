@@ -94,16 +94,17 @@ class NotebookHTTPPersonality(LoggingConfigurable):
         was available there.
         """
         handlers = []
+        base_url = url_path_join("/", self.parent.base_url)
         # Register the NotebookDownloadHandler if configuration allows
         if self.allow_notebook_download:
-            path = url_path_join("/", self.parent.base_url, r"/_api/source")
-            self.log.info(f"Registering resource: {path}, methods: (GET)")
+            path = url_path_join(base_url, r"/_api/source")
+            self.log.info("Registering resource: %s, methods: (GET)", path)
             handlers.append((path, NotebookDownloadHandler, {"path": self.parent.seed_uri}))
 
         # Register a static path handler if configuration allows
         if self.static_path is not None:
-            path = url_path_join("/", self.parent.base_url, r"/public/(.*)")
-            self.log.info(f"Registering resource: {path}, methods: (GET)")
+            path = url_path_join(base_url, r"/public/(.*)")
+            self.log.info("Registering resource: %s, methods: (GET)", path)
             handlers.append((path, tornado.web.StaticFileHandler, {"path": self.static_path}))
 
         # Discover the notebook endpoints and their implementations
@@ -119,11 +120,11 @@ class NotebookHTTPPersonality(LoggingConfigurable):
         # Cycle through the (endpoint_path, source) tuples and register their handlers
         for endpoint_path, verb_source_map in endpoints:
             parameterized_path = parameterize_path(endpoint_path)
-            parameterized_path = url_path_join("/", self.parent.base_url, parameterized_path)
+            parameterized_path = url_path_join(base_url, parameterized_path)
             self.log.info(
-                "Registering resource: {}, methods: ({})".format(
-                    parameterized_path, list(verb_source_map.keys())
-                )
+                "Registering resource: %s, methods: (%s)",
+                parameterized_path,
+                list(verb_source_map.keys()),
             )
             response_source_map = (
                 response_sources[endpoint_path] if endpoint_path in response_sources else {}
@@ -138,7 +139,7 @@ class NotebookHTTPPersonality(LoggingConfigurable):
             handlers.append((parameterized_path, NotebookAPIHandler, handler_args))
 
         # Register the swagger API spec handler
-        path = url_path_join("/", self.parent.base_url, r"/_api/spec/swagger.json")
+        path = url_path_join(base_url, r"/_api/spec/swagger.json")
         handlers.append(
             (
                 path,
@@ -150,7 +151,7 @@ class NotebookHTTPPersonality(LoggingConfigurable):
                 },
             )
         )
-        self.log.info(f"Registering resource: {path}, methods: (GET)")
+        self.log.info("Registering resource: %s, methods: (GET)", path)
 
         # Add the 404 catch-all last
         handlers.append(default_base_handlers[-1])
@@ -34,10 +34,20 @@ def first_path_param_index(endpoint):
     >>> first_path_param_index("/foo/quo/bar")
     sys.maxsize
     """
-    index = sys.maxsize
-    if endpoint.find(":") >= 0:
-        index = endpoint.count("/", 0, endpoint.find(":")) - 1
-    return index
+    param_start = endpoint.find(":")
+    if param_start < 0:
+        return sys.maxsize
+    return endpoint.count("/", 0, param_start) - 1
+
+
+def _join_sources(endpoints):
+    """Concatenates the cell sources collected for each endpoint and verb,
+    terminating each cell with a newline.
+    """
+    return {
+        uri: {verb: "\n".join(sources) + "\n" for verb, sources in verbs.items()}
+        for uri, verbs in endpoints.items()
+    }
 
 
 class APICellParser(LoggingConfigurable):
@@ -169,14 +179,15 @@ class APICellParser(LoggingConfigurable):
             element of each tuple
         """
         endpoints = {}
+        match = self.kernelspec_api_indicator.match
         for cell_source in source_cells:
-            if self.is_api_cell(cell_source):
-                matched = self.kernelspec_api_indicator.match(cell_source)
+            matched = match(cell_source)
+            if matched:
                 uri = matched.group(2).strip()
                 verb = matched.group(1)
 
-                endpoints.setdefault(uri, {}).setdefault(verb, "")
-                endpoints[uri][verb] += cell_source + "\n"
+                endpoints.setdefault(uri, {}).setdefault(verb, []).append(cell_source)
+        endpoints = _join_sources(endpoints)
 
         sorted_keys = sorted(endpoints, key=sort_func, reverse=True)
         return [(key, endpoints[key]) for key in sorted_keys]
@@ -199,15 +210,15 @@ class APICellParser(LoggingConfigurable):
             element of each tuple
         """
         endpoints = {}
+        match = self.kernelspec_api_response_indicator.match
         for cell_source in source_cells:
-            if self.is_api_response_cell(cell_source):
-                matched = self.kernelspec_api_response_indicator.match(cell_source)
+            matched = match(cell_source)
+            if matched:
                 uri = matched.group(2).strip()
                 verb = matched.group(1)
 
-                endpoints.setdefault(uri, {}).setdefault(verb, "")
-                endpoints[uri][verb] += cell_source + "\n"
-        return endpoints
+                endpoints.setdefault(uri, {}).setdefault(verb, []).append(cell_source)
+        return _join_sources(endpoints)
 
     def get_default_api_spec(self):
         """Gets the default minimum API spec to use when building a full spec
@@ -201,7 +201,7 @@ class NotebookAPIHandler(
             request_code = format_request(request, self.kernel_language)
 
             # Run the request and source code and yield until there's a result
-            access_log.debug(f"Request code for notebook cell is: {request_code}")
+            access_log.debug("Request code for notebook cell is: %s", request_code)
             await self.execute_code(kernel_client, kernel_id, request_code)
             source_result = await self.execute_code(kernel_client, kernel_id, source_code)
 
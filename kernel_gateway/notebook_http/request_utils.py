@@ -4,15 +4,19 @@
 
 import json
 import re
+from functools import lru_cache
 from typing import List, Union
 
 from tornado.httputil import HTTPHeaders, HTTPServerRequest
 
-_named_param_regex = re.compile(r"(:([^/\s]*))")
+_named_param_regex = re.compile(r":([^/\s]+)")
 FORM_URLENCODED = "application/x-www-form-urlencoded"
 MULTIPART_FORM_DATA = "multipart/form-data"
 APPLICATION_JSON = "application/json"
 TEXT_PLAIN = "text/plain"
+# Kernel language specific templates for the REQUEST assignment statement
+_request_statements = {"perl": "my $REQUEST = {}", "bash": "REQUEST={}"}
+_default_request_statement = "REQUEST = {}"
 
 
 def format_request(bundle, kernel_language: str = "") -> str:
@@ -25,16 +29,11 @@ def format_request(bundle, kernel_language: str = "") -> str:
         `REQUEST = "<json-encoded expression>"` by default or
         `<a kernel_language specific variable name> = "<json-encoded expression>"`
     """
-    bundle = json.dumps(bundle)
-    if kernel_language.lower() == "perl":
-        statement = f"my $REQUEST = {bundle}"
-    elif kernel_language.lower() == "bash":
-        statement = f"REQUEST={bundle}"
-    else:
-        statement = f"REQUEST = {bundle}"
-    return statement
+    statement = _request_statements.get(kernel_language.lower(), _default_request_statement)
+    return statement.format(json.dumps(bundle))
 
 
+@lru_cache(maxsize=1024)
 def parameterize_path(path: str) -> str:
     """Creates a regex to match all named parameters in a path.
 
@@ -49,9 +48,9 @@ def parameterize_path(path: str) -> str:
         Path with `:name` parameters replaced with regex patterns for matching
         them.
     """
-    matches = re.findall(_named_param_regex, path)
-    for match in matches:
-        path = path.replace(match[0], rf"(?P<{match[1]}>[^\/]+)")
+    # Rewrite every parameter in a single pass; replacing each match with
+    # str.replace would also clobber longer parameters sharing its prefix
+    path = _named_param_regex.sub(lambda match: rf"(?P<{match[1]}>[^\/]+)", path)
     return path.strip()
 
 
@@ -70,24 +69,22 @@ def parse_body(request: HTTPServerRequest) -> Union[str, dict]:
     dict or str
         Dictionary of a form-encoded JSON-encoded body, raw string otherwise
     """
-    content_type = TEXT_PLAIN
-    body = request.body
-    body = body.decode(encoding="UTF-8") if body else ""
-    if "Content-Type" in request.headers:
-        content_type = request.headers["Content-Type"]
-    return_body = body
+    content_type = request.headers.get("Content-Type", TEXT_PLAIN)
     if content_type == FORM_URLENCODED or content_type.startswith(MULTIPART_FORM_DATA):
         # If there is form data, we already have the values in body_arguments, we
         # just need to convert the byte arrays to strings
-        return_body = parse_args(request.body_arguments)
-    elif content_type == APPLICATION_JSON:
-        # Trying parsing the json, if we can't parse it the initial assignment
-        # will treat the body as text
+        return parse_args(request.body_arguments)
+    body = request.body
+    if not body:
+        return ""
+    if content_type == APPLICATION_JSON:
+        # Parse the raw bytes directly; if we can't parse them, fall through
+        # and treat the body as text
         try:
-            return_body = json.loads(body)
+            return json.loads(body)
         except Exception:  # noqa: S110
             pass
-    return return_body
+    return body.decode(encoding="UTF-8")
 
 
 def parse_args(args: List[str]) -> dict:
@@ -103,12 +100,9 @@ def parse_args(args: List[str]) -> dict:
     dict
         Maps keys from args to decoded strings
     """
-    rv = {}
-    for key in args:
-        rv[key] = []
-        for value in args[key]:
-            rv[key].append(value.decode(encoding="UTF-8"))
-    return rv
+    return {
+        key: [value.decode(encoding="UTF-8") for value in values] for key, values in args.items()
+    }
 
 
 def headers_to_dict(headers: HTTPHeaders) -> dict:
@@ -128,12 +122,12 @@ def headers_to_dict(headers: HTTPHeaders) -> dict:
     """
     new_headers = {}
     for header, header_value in headers.get_all():
-        if header in new_headers:
-            if not isinstance(new_headers[header], list):
-                original_value = new_headers[header]
-                new_headers[header] = [original_value]
-            new_headers[header].append(header_value)
-        else:
+        current_value = new_headers.get(header)
+        if current_value is None:
             new_headers[header] = header_value
+        elif isinstance(current_value, list):
+            current_value.append(header_value)
+        else:
+            new_headers[header] = [current_value, header_value]
 
     return new_headers
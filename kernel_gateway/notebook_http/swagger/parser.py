@@ -19,6 +19,9 @@ def _swaggerlet_from_markdown(cell_source):
     then tries to parse it as a JSON object. If it contains a 'swagger'
     property, returns it.
     """
+    # most markdown cells never mention swagger, skip splitting them into lines
+    if "swagger" not in cell_source:
+        return None
     lines = cell_source.splitlines()
     # pull out the first block comment
     if len(lines) > 2:
@@ -30,9 +33,13 @@ def _swaggerlet_from_markdown(cell_source):
             if lines[i].startswith("```"):
                 lines = lines[:i]
                 break
+    comment = "".join(lines).lstrip()
+    # skip the JSON parse for comments that cannot be a swagger object
+    if not comment.startswith("{") or '"swagger"' not in comment:
+        return None
     # parse the comment as JSON and check for a "swagger" property
     try:
-        json_comment = json.loads("".join(lines))
+        json_comment = json.loads(comment)
         if "swagger" in json_comment:
             return json_comment
     except ValueError:
@@ -84,6 +91,8 @@ class SwaggerCellParser(LoggingConfigurable):
             self.operation_response_indicator.format(comment_prefix)
         )
         self.swagger = {}
+        # maps each declared operationId to its first (endpoint, verb) declaration
+        self.operations = {}
         operationIdsFound = []
         operationIdsDeclared = []
         for cell in self.notebook_cells:
@@ -103,13 +112,17 @@ class SwaggerCellParser(LoggingConfigurable):
                     if "operationId" in self.swagger["paths"][endpoint][verb]:
                         operationId = self.swagger["paths"][endpoint][verb]["operationId"]
                         operationIdsDeclared.append(operationId)
+                        self.operations.setdefault(operationId, (endpoint, verb))
+            # check membership against sets, keeping the lists for warning order
+            operationIdsFoundSet = set(operationIdsFound)
+            operationIdsDeclaredSet = set(operationIdsDeclared)
             for operationId in operationIdsDeclared:
-                if operationId not in operationIdsFound:
+                if operationId not in operationIdsFoundSet:
                     self.log.warning(
                         f"Operation {operationId} was declared but not referenced in a cell"
                     )
             for operationId in operationIdsFound:
-                if operationId not in operationIdsDeclared:
+                if operationId not in operationIdsDeclaredSet:
                     self.log.warning(
                         f"Operation {operationId} was referenced in a cell but not declared"
                     )
@@ -222,30 +235,30 @@ class SwaggerCellParser(LoggingConfigurable):
             if matched is not None:
                 operationId = matched.group(1).strip()
                 # stripping trailing whitespace, could be a gotcha
-                operationIds.setdefault(operationId, "")
-                operationIds[operationId] += cell_source + "\n"
+                operationIds.setdefault(operationId, []).append(cell_source)
+        # concatenate each operation's sources once rather than per matching cell
+        operationIds = {
+            operationId: "\n".join(sources) + "\n" for operationId, sources in operationIds.items()
+        }
 
         # go through the declared swagger and assign source values per referenced operationIds
-        for endpoint in self.swagger["paths"].keys():
-            for verb in self.swagger["paths"][endpoint].keys():
-                if (
-                    "operationId" in self.swagger["paths"][endpoint][verb]
-                    and self.swagger["paths"][endpoint][verb]["operationId"] in operationIds
-                ):
-                    operationId = self.swagger["paths"][endpoint][verb]["operationId"]
-                    if "parameters" in self.swagger["paths"][endpoint][verb]:
-                        endpoint_with_param = endpoint
+        for endpoint, verbs in self.swagger["paths"].items():
+            for verb, operation in verbs.items():
+                if "operationId" in operation and operation["operationId"] in operationIds:
+                    source = operationIds[operation["operationId"]]
+                    if "parameters" in operation:
                         ## do we need to sort these names as well?
-                        for parameter in self.swagger["paths"][endpoint][verb]["parameters"]:
-                            if "name" in parameter:
-                                endpoint_with_param = "/:".join(
-                                    [endpoint_with_param, parameter["name"]]
-                                )
-                        mappings.setdefault(endpoint_with_param, {}).setdefault(verb, "")
-                        mappings[endpoint_with_param][verb] = operationIds[operationId]
+                        endpoint_with_param = "/:".join(
+                            [endpoint]
+                            + [
+                                parameter["name"]
+                                for parameter in operation["parameters"]
+                                if "name" in parameter
+                            ]
+                        )
+                        mappings.setdefault(endpoint_with_param, {})[verb] = source
                     else:
-                        mappings.setdefault(endpoint, {}).setdefault(verb, "")
-                        mappings[endpoint][verb] = operationIds[operationId]
+                        mappings.setdefault(endpoint, {})[verb] = source
         return mappings
 
     def get_cell_endpoint_and_verb(self, cell_source):
@@ -266,15 +279,10 @@ class SwaggerCellParser(LoggingConfigurable):
         """
         matched = self.kernelspec_operation_indicator.match(cell_source)
         if matched is not None:
-            operationId = matched.group(1)
-            # go through the declared operationIds to find corresponding endpoints, methods, and parameters
-            for endpoint in self.swagger["paths"].keys():
-                for verb in self.swagger["paths"][endpoint].keys():
-                    if (
-                        "operationId" in self.swagger["paths"][endpoint][verb]
-                        and self.swagger["paths"][endpoint][verb]["operationId"] == operationId
-                    ):
-                        return (endpoint, verb)
+            # look up the endpoint and method declaring the operationId
+            operation = self.operations.get(matched.group(1))
+            if operation is not None:
+                return operation
         return (None, None)
 
     def get_path_content(self, cell_source):
@@ -291,15 +299,10 @@ class SwaggerCellParser(LoggingConfigurable):
         just minimal response output guidance.
         """
         matched = self.kernelspec_operation_indicator.match(cell_source)
-        operationId = matched.group(1)
-        # go through the declared operationIds to find corresponding endpoints, methods, and parameters
-        for endpoint in self.swagger["paths"].keys():
-            for verb in self.swagger["paths"][endpoint].keys():
-                if (
-                    "operationId" in self.swagger["paths"][endpoint][verb]
-                    and self.swagger["paths"][endpoint][verb]["operationId"] == operationId
-                ):
-                    return self.swagger["paths"][endpoint][verb]
+        operation = self.operations.get(matched.group(1))
+        if operation is not None:
+            endpoint, verb = operation
+            return self.swagger["paths"][endpoint][verb]
         # mismatched operationId? return a default
         return {"responses": {200: {"description": "Success"}}}
 
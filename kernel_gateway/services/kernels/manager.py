@@ -2,6 +2,7 @@
 # Distributed under the terms of the Modified BSD License.
 """Kernel manager that optionally seeds kernel memory."""
 import os
+from functools import cached_property
 from typing import List, Optional
 
 from jupyter_client.ioloop import AsyncIOLoopKernelManager
@@ -14,9 +15,6 @@ class SeedingMappingKernelManager(AsyncMappingKernelManager):
     of a notebook on a kernel when it starts.
     """
 
-    _seed_source: Optional[List]
-    _seed_kernelspec: Optional[str]
-
     @default("root_dir")
     def _default_root_dir(self):
         return os.getcwd()
@@ -24,7 +22,7 @@ class SeedingMappingKernelManager(AsyncMappingKernelManager):
     def _kernel_manager_class_default(self):
         return "kernel_gateway.services.kernels.manager.KernelGatewayIOLoopKernelManager"
 
-    @property
+    @cached_property
     def seed_kernelspec(self) -> Optional[str]:
         """Gets the kernel spec name for run the seed notebook.
 
@@ -36,20 +34,13 @@ class SeedingMappingKernelManager(AsyncMappingKernelManager):
         str
             Name of the notebook kernelspec or None if no seed notebook exists
         """
-        if hasattr(self, "_seed_kernelspec"):
-            return self._seed_kernelspec
-
-        if self.parent.seed_notebook:
-            if self.parent.force_kernel_name:
-                self._seed_kernelspec = self.parent.force_kernel_name
-            else:
-                self._seed_kernelspec = self.parent.seed_notebook["metadata"]["kernelspec"]["name"]
-        else:
-            self._seed_kernelspec = None
-
-        return self._seed_kernelspec
+        if not self.parent.seed_notebook:
+            return None
+        if self.parent.force_kernel_name:
+            return self.parent.force_kernel_name
+        return self.parent.seed_notebook["metadata"]["kernelspec"]["name"]
 
-    @property
+    @cached_property
     def seed_source(self) -> Optional[List]:
         """Gets the source of the seed notebook in cell order.
 
@@ -58,19 +49,28 @@ class SeedingMappingKernelManager(AsyncMappingKernelManager):
         list
             Notebook code cell contents or None if no seed notebook exists
         """
-        if hasattr(self, "_seed_source"):
-            return self._seed_source
-
-        if self.parent.seed_notebook:
-            self._seed_source = [
-                cell["source"]
-                for cell in self.parent.seed_notebook.cells
-                if cell["cell_type"] == "code"
-            ]
-        else:
-            self._seed_source = None
+        if not self.parent.seed_notebook:
+            return None
+        return [
+            cell["source"]
+            for cell in self.parent.seed_notebook.cells
+            if cell["cell_type"] == "code"
+        ]
+
+    @cached_property
+    def seedable_source(self) -> Optional[List]:
+        """Gets the seed notebook code cells the personality wants executed
+        when seeding a new kernel, in cell order.
 
-        return self._seed_source
+        Returns
+        -------
+        list
+            Code cell contents to execute or None if no seed notebook exists
+        """
+        if self.seed_source is None:
+            return None
+        should_seed_cell = self.parent.personality.should_seed_cell
+        return [code for code in self.seed_source if should_seed_cell(code)]
 
     async def start_seeded_kernel(self, *args, **kwargs):
         """Start a kernel using the language specified in the seed notebook.
@@ -104,21 +104,18 @@ class SeedingMappingKernelManager(AsyncMappingKernelManager):
                 # Only start channels and wait for ready in HTTP mode
                 client.start_channels()
                 await client.wait_for_ready()
-                for code in self.seed_source:
-                    # Check with the personality whether it wants the cell
-                    # executed
-                    if self.parent.personality.should_seed_cell(code):
-                        client.execute(code)
-                        msg_type = "kernel_info_reply"
-                        while msg_type == "kernel_info_reply":
-                            msg = await client.get_shell_msg()
-                            msg_type = msg["msg_type"]
-                            if msg["content"]["status"] != "ok":
-                                # Shutdown the channels to remove any lingering ZMQ messages
-                                client.stop_channels()
-                                # Shutdown the kernel
-                                await self.shutdown_kernel(kernel_id)
-                                raise RuntimeError("Error seeding kernel memory", msg["content"])
+                for code in self.seedable_source:
+                    client.execute(code)
+                    msg_type = "kernel_info_reply"
+                    while msg_type == "kernel_info_reply":
+                        msg = await client.get_shell_msg()
+                        msg_type = msg["msg_type"]
+                        if msg["content"]["status"] != "ok":
+                            # Shutdown the channels to remove any lingering ZMQ messages
+                            client.stop_channels()
+                            # Shutdown the kernel
+                            await self.shutdown_kernel(kernel_id)
+                            raise RuntimeError("Error seeding kernel memory", msg["content"])
                 # Shutdown the channels to remove any lingering ZMQ messages
                 client.stop_channels()
         return kernel_id
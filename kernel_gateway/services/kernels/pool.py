@@ -3,6 +3,7 @@
 """Kernel pools that track and delegate to kernels."""
 
 import asyncio
+from collections import deque
 from typing import Awaitable, List, Optional
 
 from jupyter_client.session import Session
@@ -53,8 +54,7 @@ class KernelPool(LoggingConfigurable):
         """Shuts down all running kernels."""
         await self.pool_initialized
         kids = self.kernel_manager.list_kernel_ids()
-        for kid in kids:
-            await self.kernel_manager.shutdown_kernel(kid, now=True)
+        await asyncio.gather(*(self.kernel_manager.shutdown_kernel(kid, now=True) for kid in kids))
 
 
 class ManagedKernelPool(KernelPool):
@@ -77,15 +77,15 @@ class ManagedKernelPool(KernelPool):
         Map of kernel IDs to client instances for communicating with them
     on_recv_funcs : dict
         Map of kernel IDs to iopub callback functions
-    kernel_pool : list
-        List of available delegate kernel IDs
+    kernel_pool : collections.deque
+        Queue of available delegate kernel IDs
     kernel_semaphore : tornado.locks.Semaphore
         Semaphore that controls access to the kernel pool
     """
 
     kernel_clients: dict
     on_recv_funcs: dict
-    kernel_pool: list
+    kernel_pool: deque
     kernel_semaphore: Semaphore
     managed_pool_initialized: Future
 
@@ -93,7 +93,7 @@ class ManagedKernelPool(KernelPool):
         super().__init__()
         self.kernel_clients = {}
         self.on_recv_funcs = {}
-        self.kernel_pool = []
+        self.kernel_pool = deque()
         self.managed_pool_initialized = Future()
 
     async def initialize(self, prespawn_count, kernel_manager, **kwargs):
@@ -128,8 +128,7 @@ class ManagedKernelPool(KernelPool):
         """
         await self.managed_pool_initialized
         await self.kernel_semaphore.acquire()
-        kernel_id = self.kernel_pool[0]
-        del self.kernel_pool[0]
+        kernel_id = self.kernel_pool.popleft()
         return self.kernel_clients[kernel_id], kernel_id
 
     def release(self, kernel_id):
@@ -201,9 +200,11 @@ class ManagedKernelPool(KernelPool):
     async def shutdown(self):
         """Shuts down all kernels and their clients."""
         await self.managed_pool_initialized
-        for kid in self.kernel_clients:
-            self.kernel_clients[kid].stop_channels()
-            await self.kernel_manager.shutdown_kernel(kid, now=True)
+        for client in self.kernel_clients.values():
+            client.stop_channels()
+        await asyncio.gather(
+            *(self.kernel_manager.shutdown_kernel(kid, now=True) for kid in self.kernel_clients)
+        )
 
         # Any remaining kernels that were not created for our pool should be shutdown
         await super().shutdown()
@@ -1,9 +1,8 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 
-import logging
 import os
-from binascii import hexlify
+import secrets
 
 # isort: off
 # This must come before any Jupyter imports.
@@ -18,6 +17,8 @@ from kernel_gateway.gatewayapp import KernelGatewayApp  # noqa: E402
 pytest_plugins = ["pytest_jupyter.jupyter_core", "pytest_jupyter.jupyter_server"]
 
 
+# Must stay function scoped: it depends on the function scoped jp_environ, tmp_path
+# and parametrized jp_argv fixtures, and every test configures its own app instance.
 @pytest.fixture(scope="function")
 def jp_configurable_serverapp(
     jp_nbconvert_templates,  # this fixture must precede jp_environ
@@ -28,9 +29,9 @@ def jp_configurable_serverapp(
     jp_base_url,
     tmp_path,
     jp_root_dir,
-    jp_logging_stream,
     jp_asyncio_loop,
     io_loop,
+    request,
 ):
     """Starts a Jupyter Server instance based on
     the provided configuration values.
@@ -56,7 +57,7 @@ def jp_configurable_serverapp(
         c = Config(config)
 
         if "auth_token" not in c.KernelGatewayApp and not c.IdentityProvider.token:
-            default_token = hexlify(os.urandom(4)).decode("ascii")
+            default_token = secrets.token_hex(4)
             c.IdentityProvider.token = default_token
 
         app = KernelGatewayApp.instance(
@@ -68,8 +69,18 @@ def jp_configurable_serverapp(
             config=c,
             **kwargs,
         )
-        app.log.propagate = True
-        app.log.handlers = []
+
+        def shutdown_app():
+            try:
+                jp_asyncio_loop.run_until_complete(app.async_shutdown())
+            except (RuntimeError, SystemExit) as e:
+                print("ignoring cleanup error", e)  # noqa: T201
+            if hasattr(app, "kernel_manager"):
+                app.kernel_manager.context.destroy()
+            KernelGatewayApp.clear_instance()
+
+        # Only tests that actually create an app pay for shutting it down
+        request.addfinalizer(shutdown_app)
         # Initialize app without httpserver
         if jp_asyncio_loop.is_running():
             app.initialize(argv=argv, new_httpserver=False)
@@ -79,11 +90,8 @@ def jp_configurable_serverapp(
                 app.initialize(argv=argv, new_httpserver=False)
 
             jp_asyncio_loop.run_until_complete(initialize_app())
-        # Reroute all logging StreamHandlers away from stdin/stdout since pytest hijacks
-        # these streams and closes them at unfortunate times.
-        stream_handlers = [h for h in app.log.handlers if isinstance(h, logging.StreamHandler)]
-        for handler in stream_handlers:
-            handler.setStream(jp_logging_stream)
+        # initialize() may reconfigure logging and attach a stderr StreamHandler;
+        # route records through pytest's capture instead
         app.log.propagate = True
         app.log.handlers = []
         app.start_app()
@@ -93,16 +101,12 @@ def jp_configurable_serverapp(
 
 
 @pytest.fixture(autouse=True)
-def jp_server_cleanup(jp_asyncio_loop):
-    yield
-    app: KernelGatewayApp = KernelGatewayApp.instance()
-    try:
-        jp_asyncio_loop.run_until_complete(app.async_shutdown())
-    except (RuntimeError, SystemExit) as e:
-        print("ignoring cleanup error", e)  # noqa: T201
-    if hasattr(app, "kernel_manager"):
-        app.kernel_manager.context.destroy()
-    KernelGatewayApp.clear_instance()
+def jp_server_cleanup():
+    """Overrides the autouse ServerApp cleanup from pytest_jupyter.
+
+    Gateway apps are shut down by a finalizer registered in
+    jp_configurable_serverapp, so tests that never start one skip teardown.
+    """
 
 
 @pytest.fixture()
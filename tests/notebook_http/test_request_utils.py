@@ -104,6 +104,8 @@ class TestRequestUtils(unittest.TestCase):
         self.assertEqual(result, r"/foo/(?P<bar>[^\/]+)")
         result = parameterize_path("/foo/:bar/baz/:quo")
         self.assertEqual(result, r"/foo/(?P<bar>[^\/]+)/baz/(?P<quo>[^\/]+)")
+        result = parameterize_path("/foo/:bar/:barbaz")
+        self.assertEqual(result, r"/foo/(?P<bar>[^\/]+)/(?P<barbaz>[^\/]+)")
 
     def test_whitespace_in_paths(self):
         """Should handle whitespace in the path."""
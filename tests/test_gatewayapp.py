@@ -1,8 +1,11 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 """Tests for basic gateway app behavior."""
+import asyncio
 import os
 import ssl
+import sys
+import types
 
 import nbformat
 
@@ -39,6 +42,8 @@ class TestGatewayAppConfig:
         monkeypatch.setenv("KG_CLIENT_CA", "/test/fake_ca.crt")
         monkeypatch.setenv("KG_SSL_VERSION", "3")
         monkeypatch.setenv("KG_TRUST_XHEADERS", "false")
+        monkeypatch.setenv("KG_USE_UVLOOP", "false")
+        monkeypatch.setenv("KG_ENV_PROCESS_WHITELIST", "PATH,,HOME")
 
         app = KernelGatewayApp()
 
@@ -63,6 +68,8 @@ class TestGatewayAppConfig:
         assert app.client_ca == "/test/fake_ca.crt"
         assert app.ssl_version == 3
         assert app.trust_xheaders is False
+        assert app.use_uvloop is False
+        assert app.env_process_whitelist == ["PATH", "HOME"]
         KernelGatewayApp.clear_instance()
 
     def test_trust_xheaders(self, monkeypatch):
@@ -104,6 +111,53 @@ class TestGatewayAppConfig:
         assert "cert_reqs" not in ssl_options
         KernelGatewayApp.clear_instance()
 
+    def test_cookie_secret_empty_file(self, tmp_path):
+        secret_file = tmp_path / "jupyter_cookie_secret"
+        secret_file.write_bytes(b"")
+        app = KernelGatewayApp(cookie_secret_file=str(secret_file))
+        assert len(app.cookie_secret) == 48
+        assert secret_file.read_bytes() == app.cookie_secret
+        KernelGatewayApp.clear_instance()
+
+    def _stub_uvloop(self, monkeypatch):
+        """Installs a fake uvloop module and records event loop policy changes."""
+        uvloop = types.ModuleType("uvloop")
+        uvloop.EventLoopPolicy = type("EventLoopPolicy", (), {})
+        monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+        installed = []
+        monkeypatch.setattr(asyncio, "set_event_loop_policy", installed.append)
+        return uvloop, installed
+
+    def test_install_uvloop(self, monkeypatch):
+        uvloop, installed = self._stub_uvloop(monkeypatch)
+        app = KernelGatewayApp()
+        app._install_uvloop()
+        assert len(installed) == 1
+        assert isinstance(installed[0], uvloop.EventLoopPolicy)
+        KernelGatewayApp.clear_instance()
+
+    def test_install_uvloop_with_running_loop(self, monkeypatch):
+        _, installed = self._stub_uvloop(monkeypatch)
+        app = KernelGatewayApp()
+
+        async def install():
+            app._install_uvloop()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(install())
+        finally:
+            loop.close()
+        assert installed == []
+        KernelGatewayApp.clear_instance()
+
+    def test_use_uvloop_disabled(self, monkeypatch):
+        _, installed = self._stub_uvloop(monkeypatch)
+        app = KernelGatewayApp(use_uvloop=False)
+        app.init_io_loop()
+        assert installed == []
+        KernelGatewayApp.clear_instance()
+
     def test_load_notebook_local(self, monkeypatch):
         nb_path = os.path.join(RESOURCES, "weirdly%20named#notebook.ipynb")
         monkeypatch.setenv("KG_SEED_URI", nb_path)